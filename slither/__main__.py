@@ -207,23 +207,19 @@ def choose_detectors(
         detectors_to_run = sorted(detectors_to_run, key=lambda x: x.IMPACT)
         return detectors_to_run
 
+    excluded_impacts = set()
     if args.exclude_optimization:
-        detectors_to_run = [
-            d for d in detectors_to_run if d.IMPACT != DetectorClassification.OPTIMIZATION
-        ]
-
+        excluded_impacts.add(DetectorClassification.OPTIMIZATION)
     if args.exclude_informational:
-        detectors_to_run = [
-            d for d in detectors_to_run if d.IMPACT != DetectorClassification.INFORMATIONAL
-        ]
+        excluded_impacts.add(DetectorClassification.INFORMATIONAL)
     if args.exclude_low:
-        detectors_to_run = [d for d in detectors_to_run if d.IMPACT != DetectorClassification.LOW]
+        excluded_impacts.add(DetectorClassification.LOW)
     if args.exclude_medium:
-        detectors_to_run = [
-            d for d in detectors_to_run if d.IMPACT != DetectorClassification.MEDIUM
-        ]
+        excluded_impacts.add(DetectorClassification.MEDIUM)
     if args.exclude_high:
-        detectors_to_run = [d for d in detectors_to_run if d.IMPACT != DetectorClassification.HIGH]
+        excluded_impacts.add(DetectorClassification.HIGH)
+    if excluded_impacts:
+        detectors_to_run = [d for d in detectors_to_run if d.IMPACT not in excluded_impacts]
     if args.detectors_to_exclude:
         detectors_to_run = [
             d for d in detectors_to_run if d.ARGUMENT not in args.detectors_to_exclude
@@ -6,7 +6,7 @@ from abc import abstractmethod, ABCMeta
 from collections import namedtuple
 from enum import Enum
 from itertools import groupby
-from typing import Any, Dict, TYPE_CHECKING, List, Optional, Set, Union, Callable, Tuple
+from typing import Any, Dict, FrozenSet, TYPE_CHECKING, List, Optional, Set, Union, Callable, Tuple
 
 from slither.core.cfg.scope import Scope
 from slither.core.declarations.solidity_variables import (
@@ -165,6 +165,7 @@ class Function(SourceMapping, metaclass=ABCMeta):  # pylint: disable=too-many-pu
         self._expressions: Optional[List["Expression"]] = None
         self._slithir_operations: Optional[List["Operation"]] = None
         self._slithir_ssa_operations: Optional[List["Operation"]] = None
+        self._slithir_operation_types: Optional[FrozenSet[type]] = None
 
         self._all_expressions: Optional[List["Expression"]] = None
         self._all_slithir_operations: Optional[List["Operation"]] = None
@@ -953,6 +954,18 @@ class Function(SourceMapping, metaclass=ABCMeta):  # pylint: disable=too-many-pu
             self._slithir_ssa_operations = operations
         return self._slithir_ssa_operations
 
+    def has_slithir_operation_of_type(self, ir_type: type) -> bool:
+        """
+        Return true if one of the slithir operations is an instance of ir_type
+        Only the classes of the operations are kept between calls
+
+        :param ir_type: Operation class (subclasses are included)
+        :return: bool
+        """
+        if self._slithir_operation_types is None:
+            self._slithir_operation_types = frozenset(type(ir) for ir in self.slithir_operations)
+        return any(issubclass(t, ir_type) for t in self._slithir_operation_types)
+
     # endregion
     ###################################################################################
     ###################################################################################
@@ -1,10 +1,18 @@
+from typing import Any
+
 from slither.core.source_mapping.source_mapping import SourceMapping
 
+# Value of Expression.slithir_value while the expression is not converted, or once it was consumed
+# None is a valid SlithIR value (ex: the empty components of a tuple)
+SLITHIR_VALUE_UNSET: Any = object()
+
 
 class Expression(SourceMapping):
     def __init__(self) -> None:
         super().__init__()
         self._is_lvalue = False
+        # Result of the expression's conversion to SlithIR, consumed by its parent expression
+        self.slithir_value: Any = SLITHIR_VALUE_UNSET
 
     @property
     def is_lvalue(self) -> bool:
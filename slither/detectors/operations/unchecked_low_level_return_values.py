@@ -8,15 +8,11 @@ from slither.slithir.operations import LowLevelCall
 
 from slither.core.declarations.function_contract import FunctionContract
 from slither.core.variables.state_variable import StateVariable
-from slither.detectors.abstract_detector import (
-    AbstractDetector,
-    DetectorClassification,
-    DETECTOR_INFO,
-)
-from slither.utils.output import Output
+from slither.detectors.abstract_detector import DetectorClassification
+from slither.detectors.operations.unused_return_values import UnusedReturnValues
 
 
-class UncheckedLowLevel(AbstractDetector):
+class UncheckedLowLevel(UnusedReturnValues):
     """
     If the return value of a low-level call is not checked, it might lead to losing ether
     """
@@ -47,20 +43,26 @@ If the low level is used to prevent blocking operations, consider logging failed
 
     WIKI_RECOMMENDATION = "Ensure that the return value of a low-level call is checked or logged."
 
-    @staticmethod
-    def detect_unused_return_values(f: FunctionContract) -> List[Node]:
+    # Bound directly to avoid an extra call frame on every IR
+    _is_instance = staticmethod(LowLevelCall.is_low_level_call)
+
+    def detect_unused_return_values(self, f: FunctionContract) -> List[Node]:
         """
         Return the nodes where the return value of a call is unused
+        Unlike UnusedReturnValues, any read of the returned tuple counts as a use
         Args:
             f (Function)
         Returns:
             list(Node)
         """
+        # Most functions do not have low-level calls
+        if not f.has_slithir_operation_of_type(LowLevelCall):
+            return []
         values_returned = []
         nodes_origin = {}
         for n in f.nodes:
             for ir in n.irs:
-                if isinstance(ir, LowLevelCall):
+                if self._is_instance(ir):
                     # if a return value is stored in a state variable, it's ok
                     if ir.lvalue and not isinstance(ir.lvalue, StateVariable):
                         values_returned.append(ir.lvalue)
@@ -71,20 +73,3 @@ If the low level is used to prevent blocking operations, consider logging failed
                         values_returned.remove(read)
 
         return [nodes_origin[value].node for value in values_returned]
-
-    def _detect(self) -> List[Output]:
-        """Detect low level calls where the success value is not checked"""
-        results = []
-        for c in self.compilation_unit.contracts_derived:
-            for f in c.functions_and_modifiers:
-                unused_return = UncheckedLowLevel.detect_unused_return_values(f)
-                if unused_return:
-
-                    for node in unused_return:
-                        info: DETECTOR_INFO = [f, " ignores return value by ", node, "\n"]
-
-                        res = self.generate_result(info)
-
-                        results.append(res)
-
-        return results
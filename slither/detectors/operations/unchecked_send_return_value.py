@@ -5,7 +5,6 @@ Module detecting unused return values from send
 from slither.detectors.abstract_detector import DetectorClassification
 from slither.detectors.operations.unused_return_values import UnusedReturnValues
 from slither.slithir.operations import Send
-from slither.slithir.operations.operation import Operation
 
 
 class UncheckedSend(UnusedReturnValues):
@@ -39,5 +38,5 @@ If `send` is used to prevent blocking operations, consider logging the failed `s
 
     WIKI_RECOMMENDATION = "Ensure that the return value of `send` is checked or logged."
 
-    def _is_instance(self, ir: Operation) -> bool:  # pylint: disable=no-self-use
-        return isinstance(ir, Send)
+    # Bound directly to avoid an extra call frame on every IR
+    _is_instance = staticmethod(Send.is_send)
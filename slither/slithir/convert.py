@@ -1,6 +1,6 @@
 import logging
 from pathlib import Path
-from typing import Any, List, TYPE_CHECKING, Union, Optional, Dict
+from typing import Any, List, TYPE_CHECKING, Union, Optional, Dict, Sequence
 
 # pylint: disable= too-many-lines,import-outside-toplevel,too-many-branches,too-many-statements,too-many-nested-blocks
 from slither.core.declarations import (
@@ -445,7 +445,7 @@ def get_declared_param_names(ins: Call) -> Optional[List[str]]:
     else:
         assert False
 
-def reorder_arguments(args: List[Variable], call_names: List[str], decl_names: List[str]) -> List[Variable]:
+def reorder_arguments(args: List[Variable], call_names: Sequence[str], decl_names: List[str]) -> List[Variable]:
     """
     Reorder named struct constructor arguments so that they match struct declaration ordering rather
     than call ordering
@@ -463,7 +463,6 @@ def reorder_arguments(args: List[Variable], call_names: List[str], decl_names: L
     Reordered arguments to constructor call, now in declaration order
     """
     assert isinstance(args, list)
-    assert isinstance(call_names, list)
     assert isinstance(decl_names, list)
     assert len(args) == len(call_names)
     assert len(call_names) == len(decl_names)
@@ -524,7 +523,7 @@ def propagate_type_and_convert_call(result: List[Operation], node: "Node") -> Li
             if ins.call_id in calls_gas and isinstance(ins, (HighLevelCall, InternalDynamicCall)):
                 ins.call_gas = calls_gas[ins.call_id]
 
-        if isinstance(ins, Call) and (ins.names != None):
+        if isinstance(ins, Call) and ins.names:
             decl_param_names = get_declared_param_names(ins)
             if decl_param_names != None:
                 call_data = reorder_arguments(call_data, ins.names, decl_param_names)
@@ -751,7 +750,7 @@ def propagate_types(ir: Operation, node: "Node"):  # pylint: disable=too-many-lo
                         ir.lvalue,
                         sol_func.return_type,
                     )
-                    s.arguments.append(ir.variable_left)
+                    s.add_argument(ir.variable_left)
                     s.set_expression(ir.expression)
                     s.lvalue.set_type(sol_func.return_type)
                     s.set_node(ir.node)
@@ -1071,7 +1070,7 @@ def extract_tmp_call(ins: TmpCall, contract: Optional[Contract]) -> Union[Call,
                 lib_call.call_id = ins.call_id
                 lib_call.set_node(ins.node)
                 lib_call.function = lib_func
-                lib_call.arguments.append(ins.ori.variable_left)
+                lib_call.add_argument(ins.ori.variable_left)
                 return lib_call
             # We do not support something lik
             # library FunctionExtensions {
@@ -1537,7 +1536,7 @@ def look_for_library_or_top_level(
 ) -> Optional[Union[LibraryCall, InternalCall,]]:
     for destination in using_for[t]:
         if isinstance(destination, FunctionTopLevel) and destination.name == ir.function_name:
-            arguments = [ir.destination] + ir.arguments
+            arguments = [ir.destination, *ir.arguments]
             if (
                 len(destination.parameters) == len(arguments)
                 and _find_function_from_parameter(arguments, [destination], True) is not None
@@ -1545,7 +1544,7 @@ def look_for_library_or_top_level(
                 internalcall = InternalCall(destination, ir.nbr_arguments, ir.lvalue, ir.type_call, names=ir.names)
                 internalcall.set_expression(ir.expression)
                 internalcall.set_node(ir.node)
-                internalcall.arguments = [ir.destination] + ir.arguments
+                internalcall.arguments = [ir.destination, *ir.arguments]
                 return_type = internalcall.function.return_type
                 if return_type:
                     if len(return_type) == 1:
@@ -1573,7 +1572,7 @@ def look_for_library_or_top_level(
             lib_call.set_expression(ir.expression)
             lib_call.set_node(ir.node)
             lib_call.call_gas = ir.call_gas
-            lib_call.arguments = [ir.destination] + ir.arguments
+            lib_call.arguments = [ir.destination, *ir.arguments]
             new_ir = convert_type_library_call(lib_call, lib_contract)
             if new_ir:
                 new_ir.set_node(ir.node)
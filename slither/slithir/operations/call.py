@@ -1,28 +1,46 @@
-from typing import Optional, List, Union
+import sys
+from typing import Optional, List, Sequence, Tuple, Union
 
 from slither.core.declarations import Function
 from slither.core.variables import Variable
 from slither.slithir.operations.operation import Operation
 
+# Shared by all the calls without arguments or without named arguments
+_EMPTY: Tuple = ()
 
-class Call(Operation):
-    def __init__(self, names : Optional[List[str]] = None) -> None:
-        super().__init__()
-        assert (names == None) or isinstance(names, list)
-        self._arguments: List[Variable] = []
-        self._names: Optional[List[str]] = names
 
-    @property
-    def names(self) -> Optional[List[str]]:
-        return self._names
+class Call(Operation):
+    __slots__ = ["arguments", "names"]
 
-    @property
-    def arguments(self) -> List[Variable]:
-        return self._arguments
+    def __init__(self, names : Optional[Sequence[str]] = None) -> None:
+        super().__init__()
+        # Replaced by a list when the arguments are set, or on the first add_argument
+        self.arguments: Sequence[Variable] = _EMPTY
+        # For calls of the form f({argName1 : arg1, ...}), the names of the arguments in call order
+        # Empty if the call does not use named arguments
+        self.names: Tuple[str, ...] = _EMPTY
+        if names:
+            # A tuple comes from another call (ex: its SSA version) and is shared as it is
+            # Otherwise the names are interned, interned strings are freed once no longer used
+            self.names = names if isinstance(names, tuple) else tuple(map(sys.intern, names))
+
+    def add_argument(self, arg: Variable) -> None:
+        """
+        Append an argument
+        On a frozen call, the arguments are thawed back into a list first
+        """
+        if isinstance(self.arguments, tuple):
+            self.arguments = list(self.arguments)
+        self.arguments.append(arg)
 
-    @arguments.setter
-    def arguments(self, v: List[Variable]) -> None:
-        self._arguments = v
+    def freeze(self) -> None:
+        """
+        Store the arguments as a tuple, to drop the over-allocation of the list
+        Called once the slithIR generation is done, the arguments are then a tuple
+        A frozen call is thawed by add_argument, or by assigning a list to arguments
+        Code running after the analysis must not assume the arguments are a list
+        """
+        self.arguments = tuple(self.arguments)
 
     # pylint: disable=no-self-use
     def can_reenter(self, _callstack: Optional[List[Union[Function, Variable]]] = None) -> bool:
@@ -3,6 +3,7 @@ from typing import List, Union, Optional
 from slither.core.declarations import Function
 from slither.slithir.operations.call import Call
 from slither.slithir.operations.lvalue import OperationWithLValue
+from slither.slithir.operations.type_registry import TypeRegistry
 from slither.core.variables.variable import Variable
 from slither.core.declarations.solidity_variables import SolidityVariable
 
@@ -15,11 +16,23 @@ from slither.slithir.variables.tuple import TupleVariable
 from slither.slithir.variables.tuple_ssa import TupleVariableSSA
 
 
-class LowLevelCall(Call, OperationWithLValue):  # pylint: disable=too-many-instance-attributes
+class LowLevelCall(
+    Call, OperationWithLValue, TypeRegistry
+):  # pylint: disable=too-many-instance-attributes
     """
     High level message call
     """
 
+    @staticmethod
+    def is_low_level_call(ir: object) -> bool:
+        """
+        Faster equivalent of isinstance(ir, LowLevelCall)
+        :return: bool
+        """
+        ir_type = type(ir)
+        # LowLevelCall itself is by far the most common case
+        return ir_type is LowLevelCall or ir_type in LowLevelCall._registered_types
+
     def __init__(
         self,
         destination: Union[LocalVariable, LocalIRVariable, TemporaryVariableSSA, TemporaryVariable],
@@ -37,33 +50,33 @@ class LowLevelCall(Call, OperationWithLValue):  # pylint: disable=too-many-insta
         self._nbr_arguments = nbr_arguments
         self._type_call = type_call
         self._lvalue = result
-        self._callid = None  # only used if gas/value != 0
+        self._callid: Optional[str] = None  # only used if gas/value != 0
 
-        self._call_value = None
-        self._call_gas = None
+        self._call_value: Optional[Union[Variable, SolidityVariable]] = None
+        self._call_gas: Optional[Union[Variable, SolidityVariable]] = None
 
     @property
-    def call_id(self):
+    def call_id(self) -> Optional[str]:
         return self._callid
 
     @call_id.setter
-    def call_id(self, c):
+    def call_id(self, c: Optional[str]) -> None:
         self._callid = c
 
     @property
-    def call_value(self):
+    def call_value(self) -> Optional[Union[Variable, SolidityVariable]]:
         return self._call_value
 
     @call_value.setter
-    def call_value(self, v):
+    def call_value(self, v: Optional[Union[Variable, SolidityVariable]]) -> None:
         self._call_value = v
 
     @property
-    def call_gas(self):
+    def call_gas(self) -> Optional[Union[Variable, SolidityVariable]]:
         return self._call_gas
 
     @call_gas.setter
-    def call_gas(self, v):
+    def call_gas(self, v: Optional[Union[Variable, SolidityVariable]]) -> None:
         self._call_gas = v
 
     @property
@@ -72,7 +85,7 @@ class LowLevelCall(Call, OperationWithLValue):  # pylint: disable=too-many-insta
     ) -> List[
         Union[LocalIRVariable, Constant, LocalVariable, TemporaryVariableSSA, TemporaryVariable]
     ]:
-        all_read = [self.destination, self.call_gas, self.call_value] + self.arguments
+        all_read = [self.destination, self.call_gas, self.call_value] + list(self.arguments)
         # remove None
         return self._unroll([x for x in all_read if x])
 
@@ -25,7 +25,6 @@ class NewStructure(Call, OperationWithLValue):
         self._structure = structure
         # todo create analyze to add the contract instance
         self._lvalue = lvalue
-        self._names = names
 
     @property
     def read(self) -> List[Union[TemporaryVariableSSA, TemporaryVariable, Constant]]:
@@ -29,6 +29,8 @@ class AbstractOperation(abc.ABC):
 
 
 class Operation(Context, AbstractOperation):
+    __slots__ = ["_node", "_expression"]
+
     def __init__(self) -> None:
         super().__init__()
         self._node: Optional["Node"] = None
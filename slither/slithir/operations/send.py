@@ -4,6 +4,7 @@ from slither.core.declarations.solidity_variables import SolidityVariable
 from slither.core.variables.variable import Variable
 from slither.slithir.operations.call import Call
 from slither.slithir.operations.lvalue import OperationWithLValue
+from slither.slithir.operations.type_registry import TypeRegistry
 from slither.slithir.utils.utils import is_valid_lvalue
 from slither.core.variables.local_variable import LocalVariable
 from slither.slithir.variables.constant import Constant
@@ -12,7 +13,17 @@ from slither.slithir.variables.temporary import TemporaryVariable
 from slither.slithir.variables.temporary_ssa import TemporaryVariableSSA
 
 
-class Send(Call, OperationWithLValue):
+class Send(Call, OperationWithLValue, TypeRegistry):
+    @staticmethod
+    def is_send(ir: object) -> bool:
+        """
+        Faster equivalent of isinstance(ir, Send)
+        :return: bool
+        """
+        ir_type = type(ir)
+        # Send itself is by far the most common case
+        return ir_type is Send or ir_type in Send._registered_types
+
     def __init__(
         self,
         destination: Union[LocalVariable, LocalIRVariable],
@@ -0,0 +1,20 @@
+from typing import Set
+
+
+class TypeRegistry:  # pylint: disable=too-few-public-methods
+    """
+    Record a class and all its subclasses
+    The root is the class that lists TypeRegistry in its bases
+    isinstance(ir, Root) is then equivalent to type(ir) in Root._registered_types
+    """
+
+    __slots__ = ()
+
+    _registered_types: Set[type]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if TypeRegistry in cls.__bases__:
+            cls._registered_types = {cls}
+        else:
+            cls._registered_types.add(cls)
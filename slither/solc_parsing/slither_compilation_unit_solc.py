@@ -3,13 +3,14 @@ import logging
 import os
 import re
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Set
 
 from slither.analyses.data_dependency.data_dependency import compute_dependency
 from slither.core.compilation_unit import SlitherCompilationUnit
 from slither.core.declarations import Contract
 from slither.core.declarations.custom_error_top_level import CustomErrorTopLevel
 from slither.core.declarations.enum_top_level import EnumTopLevel
+from slither.core.declarations.function import Function, FunctionType
 from slither.core.declarations.function_top_level import FunctionTopLevel
 from slither.core.declarations.import_directive import Import
 from slither.core.declarations.pragma_directive import Pragma
@@ -19,6 +20,7 @@ from slither.core.scope.scope import FileScope
 from slither.core.solidity_types import ElementaryType, TypeAliasTopLevel
 from slither.core.variables.top_level_variable import TopLevelVariable
 from slither.exceptions import SlitherException
+from slither.slithir.operations import Call
 from slither.solc_parsing.declarations.caller_context import CallerContextExpression
 from slither.solc_parsing.declarations.contract import ContractSolc
 from slither.solc_parsing.declarations.custom_error import CustomErrorSolc
@@ -811,4 +813,29 @@ Please rename it, this name is reserved for Slither's internals"""
             contract.fix_phi()
             contract.update_read_write_using_ssa()
 
+        self._freeze_slithir()
+
+    def _freeze_slithir(self) -> None:
+        """
+        The call arguments are not modified once the IR and SSA are generated
+        """
+        # Includes the top level functions
+        functions: Set[Function] = set(self._compilation_unit.functions_and_modifiers)
+        # The constructors initializing the state variables are only registered in their contract
+        for contract in self._compilation_unit.contracts:
+            functions.update(
+                func
+                for func in contract.functions
+                if func.function_type
+                in (FunctionType.CONSTRUCTOR_VARIABLES, FunctionType.CONSTRUCTOR_CONSTANT_VARIABLES)
+            )
+        for func in functions:
+            for node in func.nodes:
+                for ir in node.irs:
+                    if isinstance(ir, Call):
+                        ir.freeze()
+                for ir in node.irs_ssa:
+                    if isinstance(ir, Call):
+                        ir.freeze()
+
     # endregion
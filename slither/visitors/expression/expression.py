@@ -23,6 +23,8 @@ logger = logging.getLogger("ExpressionVisitor")
 
 # pylint: disable=too-few-public-methods
 class ExpressionVisitor:
+    __slots__ = ["_expression"]
+
     def __init__(self, expression: Expression) -> None:
         super().__init__()
         # Inherited class must declare their variables prior calling super().__init__
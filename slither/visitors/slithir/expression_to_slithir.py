@@ -1,5 +1,5 @@
 import logging
-from typing import Union, List, TYPE_CHECKING, Any
+from typing import Callable, Dict, Union, List, Optional, Set, Tuple, TYPE_CHECKING, Any
 
 from slither.core import expressions
 from slither.core.declarations import (
@@ -25,7 +25,7 @@ from slither.core.expressions import (
     NewElementaryType,
 )
 from slither.core.expressions.binary_operation import BinaryOperation
-from slither.core.expressions.expression import Expression
+from slither.core.expressions.expression import Expression, SLITHIR_VALUE_UNSET
 from slither.core.expressions.index_access import IndexAccess
 from slither.core.expressions.literal import Literal
 from slither.core.expressions.new_array import NewArray
@@ -66,6 +66,9 @@ from slither.slithir.variables import (
     TemporaryVariable,
     TupleVariable,
 )
+# slither.core.cfg.node imports this module through slither.slithir.convert
+# Importing the module rather than NodeType does not depend on which one is loaded first
+import slither.core.cfg.node as cfg_node
 from slither.visitors.expression.expression import ExpressionVisitor
 from slither.visitors.expression.constants_folding import ConstantFolding, NotConstant
 from slither.core.solidity_types.user_defined_type import UserDefinedType
@@ -78,18 +81,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("VISTIOR:ExpressionToSlithIR")
 
-key = "expressionToSlithIR"
-
 
 def get(expression: Expression) -> Any:
-    val = expression.context[key]
-    # we delete the item to reduce memory use
-    del expression.context[key]
+    val = expression.slithir_value
+    if val is SLITHIR_VALUE_UNSET:
+        raise SlithIRError(f"No SlithIR value for {expression}, or its value was already used")
+    # we reset the value to reduce memory use
+    expression.slithir_value = SLITHIR_VALUE_UNSET
     return val
 
 
 def set_val(expression: Expression, val: Any) -> None:
-    expression.context[key] = val
+    expression.slithir_value = val
 
 
 _binary_to_binary = {
@@ -122,6 +125,48 @@ _signed_to_unsigned = {
     BinaryOperationType.RIGHT_SHIFT_ARITHMETIC: BinaryType.RIGHT_SHIFT,
 }
 
+# Elementary types used by the conversion, shared as they are never modified
+_uint256_type = ElementaryType("uint256")
+_int256_type = ElementaryType("int256")
+_bool_type = ElementaryType("bool")
+_string_type = ElementaryType("string")
+_address_type = ElementaryType("address")
+
+_this = SolidityVariable("this")
+
+# Yul builtins reading a Solidity variable
+_yul_to_solidity_variable = {
+    "caller()": SolidityVariableComposed("msg.sender"),
+    "origin()": SolidityVariableComposed("tx.origin"),
+    "callvalue()": SolidityVariableComposed("msg.value"),
+}
+
+# Yul builtins converted by _convert_yul_builtin_call
+_yul_builtins = frozenset(
+    ["extcodesize(uint256)", "selfbalance()", "address()", *_yul_to_solidity_variable]
+)
+
+# Binary operation applied by ++ and --
+_unary_step = {
+    UnaryOperationType.PLUSPLUS_PRE: BinaryType.ADDITION,
+    UnaryOperationType.MINUSMINUS_PRE: BinaryType.SUBTRACTION,
+    UnaryOperationType.PLUSPLUS_POST: BinaryType.ADDITION,
+    UnaryOperationType.MINUSMINUS_POST: BinaryType.SUBTRACTION,
+}
+
+_assignment_to_binary = {
+    AssignmentOperationType.ASSIGN_OR: BinaryType.OR,
+    AssignmentOperationType.ASSIGN_CARET: BinaryType.CARET,
+    AssignmentOperationType.ASSIGN_AND: BinaryType.AND,
+    AssignmentOperationType.ASSIGN_LEFT_SHIFT: BinaryType.LEFT_SHIFT,
+    AssignmentOperationType.ASSIGN_RIGHT_SHIFT: BinaryType.RIGHT_SHIFT,
+    AssignmentOperationType.ASSIGN_ADDITION: BinaryType.ADDITION,
+    AssignmentOperationType.ASSIGN_SUBTRACTION: BinaryType.SUBTRACTION,
+    AssignmentOperationType.ASSIGN_MULTIPLICATION: BinaryType.MULTIPLICATION,
+    AssignmentOperationType.ASSIGN_DIVISION: BinaryType.DIVISION,
+    AssignmentOperationType.ASSIGN_MODULO: BinaryType.MODULO,
+}
+
 
 def convert_assignment(
     left: Union[LocalVariable, StateVariable, ReferenceVariable],
@@ -129,43 +174,115 @@ def convert_assignment(
     t: AssignmentOperationType,
     return_type: Type,
 ) -> Union[Binary, Assignment]:
-    if t == AssignmentOperationType.ASSIGN:
+    if t is AssignmentOperationType.ASSIGN:
         return Assignment(left, right, return_type)
-    if t == AssignmentOperationType.ASSIGN_OR:
-        return Binary(left, left, right, BinaryType.OR)
-    if t == AssignmentOperationType.ASSIGN_CARET:
-        return Binary(left, left, right, BinaryType.CARET)
-    if t == AssignmentOperationType.ASSIGN_AND:
-        return Binary(left, left, right, BinaryType.AND)
-    if t == AssignmentOperationType.ASSIGN_LEFT_SHIFT:
-        return Binary(left, left, right, BinaryType.LEFT_SHIFT)
-    if t == AssignmentOperationType.ASSIGN_RIGHT_SHIFT:
-        return Binary(left, left, right, BinaryType.RIGHT_SHIFT)
-    if t == AssignmentOperationType.ASSIGN_ADDITION:
-        return Binary(left, left, right, BinaryType.ADDITION)
-    if t == AssignmentOperationType.ASSIGN_SUBTRACTION:
-        return Binary(left, left, right, BinaryType.SUBTRACTION)
-    if t == AssignmentOperationType.ASSIGN_MULTIPLICATION:
-        return Binary(left, left, right, BinaryType.MULTIPLICATION)
-    if t == AssignmentOperationType.ASSIGN_DIVISION:
-        return Binary(left, left, right, BinaryType.DIVISION)
-    if t == AssignmentOperationType.ASSIGN_MODULO:
-        return Binary(left, left, right, BinaryType.MODULO)
+    binary_type = _assignment_to_binary.get(t)
+    if binary_type is not None:
+        return Binary(left, left, right, binary_type)
 
     raise SlithIRError("Missing type during assignment conversion")
 
 
+def _no_children(_expression: Expression) -> List[Optional[Expression]]:
+    return []
+
+
+def _single_child(
+    expression: Union[MemberAccess, expressions.TypeConversion, UnaryOperation]
+) -> List[Optional[Expression]]:
+    return [expression.expression]
+
+
+def _left_right_children(
+    expression: Union[AssignmentOperation, BinaryOperation, IndexAccess]
+) -> List[Optional[Expression]]:
+    return [expression.expression_left, expression.expression_right]
+
+
+def _call_children(expression: CallExpression) -> List[Optional[Expression]]:
+    children = [expression.called]
+    children += [arg for arg in expression.arguments if arg]
+    if expression.call_value:
+        children.append(expression.call_value)
+    if expression.call_gas:
+        children.append(expression.call_gas)
+    if expression.call_salt:
+        children.append(expression.call_salt)
+    return children
+
+
+def _conditional_children(expression: ConditionalExpression) -> List[Optional[Expression]]:
+    return [expression.if_expression, expression.else_expression, expression.then_expression]
+
+
+def _tuple_children(expression: TupleExpression) -> List[Optional[Expression]]:
+    return [e for e in expression.expressions if e]
+
+
+# Children and post visit handler of each expression class
+# Follows the order of the isinstance checks of ExpressionVisitor
+_expression_visits: List[Tuple[type, Callable[[Any], List[Optional[Expression]]], str]] = [
+    (AssignmentOperation, _left_right_children, "_post_assignement_operation"),
+    (BinaryOperation, _left_right_children, "_post_binary_operation"),
+    (CallExpression, _call_children, "_post_call_expression"),
+    (ConditionalExpression, _conditional_children, "_post_conditional_expression"),
+    (ElementaryTypeNameExpression, _no_children, "_post_elementary_type_name_expression"),
+    (Identifier, _no_children, "_post_identifier"),
+    (IndexAccess, _left_right_children, "_post_index_access"),
+    (Literal, _no_children, "_post_literal"),
+    (MemberAccess, _single_child, "_post_member_access"),
+    (NewArray, _no_children, "_post_new_array"),
+    (NewContract, _no_children, "_post_new_contract"),
+    (NewElementaryType, _no_children, "_post_new_elementary_type"),
+    (TupleExpression, _tuple_children, "_post_tuple_expression"),
+    (expressions.TypeConversion, _single_child, "_post_type_conversion"),
+    (UnaryOperation, _single_child, "_post_unary_operation"),
+]
+
+# Memoize the lookup in _expression_visits per concrete expression type
+_expression_visits_by_type: Dict[type, Tuple[Callable[[Any], List[Optional[Expression]]], str]] = {}
+
+
+def _expression_visit(
+    expression_type: type,
+) -> Tuple[Callable[[Any], List[Optional[Expression]]], str]:
+    visit = _expression_visits_by_type.get(expression_type)
+    if visit is None:
+        for expression_class, children, post_visit in _expression_visits:
+            if issubclass(expression_type, expression_class):
+                visit = (children, post_visit)
+                break
+        else:
+            raise SlithIRError(f"Expression not handled: {expression_type}")
+        _expression_visits_by_type[expression_type] = visit
+    return visit
+
+
 class ExpressionToSlithIR(ExpressionVisitor):
+    __slots__ = [
+        "_node",
+        "_fold_constants",
+        "_not_constants",
+        "_is_statement",
+        "_this_as_address",
+        "_result",
+    ]
 
     # pylint: disable=super-init-not-called
     def __init__(self, expression: Expression, node: "Node") -> None:
-        from slither.core.cfg.node import NodeType  # pylint: disable=import-outside-toplevel
-
         self._expression = expression
         self._node = node
+        # Constant folding is only done when generating the Certik IR
+        self._fold_constants = node.compilation_unit.generates_certik_ir
+        # Sub-expressions on which the constant folding failed
+        self._not_constants: Set[Expression] = set()
+        # The value of an expression statement is not used
+        self._is_statement = node.type is cfg_node.NodeType.EXPRESSION
+        # address(this), shared by the selfbalance() and address() calls of the node
+        self._this_as_address: Optional[TemporaryVariable] = None
         self._result: List[Operation] = []
         self._visit_expression(self.expression)
-        if node.type == NodeType.RETURN:
+        if node.type is cfg_node.NodeType.RETURN:
             r = Return(get(self.expression))
             r.set_expression(expression)
             self._result.append(r)
@@ -175,6 +292,24 @@ class ExpressionToSlithIR(ExpressionVisitor):
     def result(self) -> List[Operation]:
         return self._result
 
+    def _visit_expression(self, expression: Expression) -> None:
+        """
+        Iterative post-order walk, equivalent to ExpressionVisitor._visit_expression
+        Deeply nested expressions do not grow the Python stack
+        The _pre_* hooks are not called, as ExpressionToSlithIR does not use them
+        """
+        # An expression is pushed without its post visit handler before its children are visited,
+        # and with it once they are
+        stack: List[Tuple[Optional[Expression], Optional[str]]] = [(expression, None)]
+        while stack:
+            current, post_visit = stack.pop()
+            if post_visit is not None:
+                getattr(self, post_visit)(current)
+            elif current is not None:
+                children, post_visit = _expression_visit(type(current))
+                stack.append((current, post_visit))
+                stack.extend((child, None) for child in reversed(children(current)))
+
     def _post_assignement_operation(self, expression: AssignmentOperation) -> None:
         left = get(expression.expression_left)
         right = get(expression.expression_right)
@@ -247,9 +382,15 @@ class ExpressionToSlithIR(ExpressionVisitor):
     def _attempt_constant_folding(self, expression):
         if isinstance(expression.type, str) and not expression.type in ElementaryTypeName:
             return False
+        # ConstantFolding visits the children again, it fails if one of them already failed
+        children, _ = _expression_visit(type(expression))
+        if any(child in self._not_constants for child in children(expression)):
+            self._not_constants.add(expression)
+            return False
         try:
             const_fold = ConstantFolding(expression, expression.type)
         except (NotConstant, AttributeError):
+            self._not_constants.add(expression)
             return False
 
         const_value = const_fold.result()
@@ -258,48 +399,42 @@ class ExpressionToSlithIR(ExpressionVisitor):
         # expression.type holds the kind of binary/unary operation, not the Solidity type.
         # So, we don't have actual Solidity type here and need to guess the type for the Constant value.
         if expression.type in _signed_to_unsigned:
-            new_type = ElementaryType("uint")
+            new_type = _uint256_type
         elif isinstance(const_value.value, bool):
-            new_type = ElementaryType("bool")
+            new_type = _bool_type
         elif isinstance(const_value.value, int):
-            new_type = ElementaryType("int")
+            new_type = _int256_type
         else:
-            new_type = ElementaryType("string")
+            new_type = _string_type
         cst = Constant(str(const_value.value), new_type)
         set_val(expression, cst)
         return True
 
     def _post_binary_operation(self, expression: BinaryOperation) -> None:
-        if self._node.compilation_unit.generates_certik_ir and self._attempt_constant_folding(expression):
+        if self._fold_constants and self._attempt_constant_folding(expression):
             return
 
         left = get(expression.expression_left)
         right = get(expression.expression_right)
         val = TemporaryVariable(self._node)
 
-        if expression.type in _signed_to_unsigned:
-            new_left = TemporaryVariable(self._node)
-            conv_left = TypeConversion(new_left, left, ElementaryType("int256"))
-            new_left.set_type(ElementaryType("int256"))
-            conv_left.set_expression(expression)
-            self._result.append(conv_left)
-
-            if expression.type != BinaryOperationType.RIGHT_SHIFT_ARITHMETIC:
-                new_right = TemporaryVariable(self._node)
-                conv_right = TypeConversion(new_right, right, ElementaryType("int256"))
-                new_right.set_type(ElementaryType("int256"))
-                conv_right.set_expression(expression)
-                self._result.append(conv_right)
+        # Signed YUL operations are converted to their unsigned counterpart on int256
+        unsigned_type = _signed_to_unsigned.get(expression.type)
+        if unsigned_type is not None:
+            new_left = self._convert_to_int256(expression, left)
+
+            if expression.type is not BinaryOperationType.RIGHT_SHIFT_ARITHMETIC:
+                new_right = self._convert_to_int256(expression, right)
             else:
                 new_right = right
 
             new_final = TemporaryVariable(self._node)
-            operation = Binary(new_final, new_left, new_right, _signed_to_unsigned[expression.type])
+            operation = Binary(new_final, new_left, new_right, unsigned_type)
             operation.set_expression(expression)
             self._result.append(operation)
 
-            conv_final = TypeConversion(val, new_final, ElementaryType("uint256"))
-            val.set_type(ElementaryType("uint256"))
+            conv_final = TypeConversion(val, new_final, _uint256_type)
+            val.set_type(_uint256_type)
             conv_final.set_expression(expression)
             self._result.append(conv_final)
         else:
@@ -309,40 +444,68 @@ class ExpressionToSlithIR(ExpressionVisitor):
 
         set_val(expression, val)
 
+    def _convert_to_int256(self, expression: BinaryOperation, value: Any) -> Any:
+        """
+        Return value converted to int256
+        No conversion is generated if value is already an int256
+        """
+        value_type = getattr(value, "type", None)
+        if isinstance(value_type, ElementaryType) and value_type.type == "int256":
+            return value
+        new_value = TemporaryVariable(self._node)
+        conversion = TypeConversion(new_value, value, _int256_type)
+        new_value.set_type(_int256_type)
+        conversion.set_expression(expression)
+        self._result.append(conversion)
+        return new_value
+
     # pylint: disable=too-many-branches,too-many-statements,too-many-locals
     def _post_call_expression(self, expression: CallExpression) -> None:
 
         assert isinstance(expression, CallExpression)
 
+        # Bound once, the conversion of a call appends one IR per argument
+        node = self._node
+        append_ir = self._result.append
+
         expression_called = expression.called
         called = get(expression_called)
 
-        args = [get(a) for a in expression.arguments if a]
         val: Union[TupleVariable, TemporaryVariable]
         var: Operation
-        for arg in args:
-            arg_ = Argument(arg)
-            arg_.set_expression(expression)
-            self._result.append(arg_)
+        # Past the Argument IRs, only the number of arguments and the first one are used
+        n_args = 0
+        first_arg = None
+        for a in expression.arguments:
+            if a:
+                arg = get(a)
+                if n_args == 0:
+                    first_arg = arg
+                arg_ = Argument(arg)
+                arg_.set_expression(expression)
+                append_ir(arg_)
+                n_args += 1
+
         if isinstance(called, Function):
             # internal call
 
-            # If tuple
+            # Function.returns copies the list of return variables on each access
+            returns = called.returns
 
-            if expression.type_call.startswith("tuple(") and expression.type_call != "tuple()":
-                val = TupleVariable(self._node)
-                val.set_type(list(map(lambda x: x.type, called.returns)))
+            # If tuple
+            type_call = expression.type_call
+            if type_call.startswith("tuple(") and type_call != "tuple()":
+                val = TupleVariable(node)
+                val.set_type([ret.type for ret in returns])
             else:
-                assert len(called.returns) <= 1
-                val = TemporaryVariable(
-                    self._node,
-                    location = called.returns[0].location if len(called.returns) == 1 else None
-                )
-                if len(called.returns) == 1:
-                    val.set_type(called.returns[0].type)
-            internal_call = InternalCall(called, len(args), val, expression.type_call, names=expression.names)
+                assert len(returns) <= 1
+                ret = returns[0] if returns else None
+                val = TemporaryVariable(node, location=ret.location if ret is not None else None)
+                if ret is not None:
+                    val.set_type(ret.type)
+            internal_call = InternalCall(called, n_args, val, type_call, names=expression.names)
             internal_call.set_expression(expression)
-            self._result.append(internal_call)
+            append_ir(internal_call)
             set_val(expression, val)
 
         # User defined types
@@ -350,66 +513,33 @@ class ExpressionToSlithIR(ExpressionVisitor):
             isinstance(called, TypeAlias)
             and isinstance(expression_called, MemberAccess)
             and expression_called.member_name in ["wrap", "unwrap"]
-            and len(args) == 1
+            and n_args == 1
         ):
             # wrap: underlying_type -> alias
             # unwrap: alias -> underlying_type
             dest_type: Union[TypeAlias, ElementaryType] = (
                 called if expression_called.member_name == "wrap" else called.underlying_type
             )
-            val = TemporaryVariable(self._node)
-            var = TypeConversion(val, args[0], dest_type)
+            val = TemporaryVariable(node)
+            var = TypeConversion(val, first_arg, dest_type)
             var.set_expression(expression)
             val.set_type(dest_type)
-            self._result.append(var)
+            append_ir(var)
             set_val(expression, val)
 
         # yul things
-        elif called.name == "caller()":
-            val = TemporaryVariable(self._node)
-            var = Assignment(val, SolidityVariableComposed("msg.sender"), ElementaryType("uint256"))
-            self._result.append(var)
-            set_val(expression, val)
-        elif called.name == "origin()":
-            val = TemporaryVariable(self._node)
-            var = Assignment(val, SolidityVariableComposed("tx.origin"), ElementaryType("uint256"))
-            self._result.append(var)
-            set_val(expression, val)
-        elif called.name == "extcodesize(uint256)":
-            val_ref = ReferenceVariable(self._node)
-            var = Member(args[0], Constant("codesize"), val_ref)
-            self._result.append(var)
-            set_val(expression, val_ref)
-        elif called.name == "selfbalance()":
-            val = TemporaryVariable(self._node)
-            var = TypeConversion(val, SolidityVariable("this"), ElementaryType("address"))
-            val.set_type(ElementaryType("address"))
-            self._result.append(var)
-
-            val1 = ReferenceVariable(self._node)
-            var1 = Member(val, Constant("balance"), val1)
-            self._result.append(var1)
-            set_val(expression, val1)
-        elif called.name == "address()":
-            val = TemporaryVariable(self._node)
-            var = TypeConversion(val, SolidityVariable("this"), ElementaryType("address"))
-            val.set_type(ElementaryType("address"))
-            self._result.append(var)
-            set_val(expression, val)
-        elif called.name == "callvalue()":
-            val = TemporaryVariable(self._node)
-            var = Assignment(val, SolidityVariableComposed("msg.value"), ElementaryType("uint256"))
-            self._result.append(var)
-            set_val(expression, val)
+        elif called.name in _yul_builtins:
+            self._convert_yul_builtin_call(expression, called.name, first_arg)
 
         else:
             # If tuple
-            if expression.type_call.startswith("tuple(") and expression.type_call != "tuple()":
-                val = TupleVariable(self._node)
+            type_call = expression.type_call
+            if type_call.startswith("tuple(") and type_call != "tuple()":
+                val = TupleVariable(node)
             else:
-                val = TemporaryVariable(self._node)
+                val = TemporaryVariable(node)
 
-            message_call = TmpCall(called, len(args), val, expression.type_call, names=expression.names)
+            message_call = TmpCall(called, n_args, val, type_call, names=expression.names)
             message_call.set_expression(expression)
             # Gas/value are only accessible here if the syntax {gas: , value: }
             # Is used over .gas().value()
@@ -422,8 +552,39 @@ class ExpressionToSlithIR(ExpressionVisitor):
             if expression.call_salt:
                 call_salt = get(expression.call_salt)
                 message_call.call_salt = call_salt
-            self._result.append(message_call)
+            append_ir(message_call)
+            set_val(expression, val)
+
+    def _convert_yul_builtin_call(
+        self, expression: CallExpression, name: str, first_arg: Any
+    ) -> None:
+        var: Operation
+        if name in _yul_to_solidity_variable:
+            val = TemporaryVariable(self._node)
+            var = Assignment(val, _yul_to_solidity_variable[name], _uint256_type)
+            self._result.append(var)
             set_val(expression, val)
+        elif name == "extcodesize(uint256)":
+            val_ref = ReferenceVariable(self._node)
+            var = Member(first_arg, Constant("codesize"), val_ref)
+            self._result.append(var)
+            set_val(expression, val_ref)
+        else:
+            # selfbalance() and address()
+            val = self._this_as_address
+            if val is None:
+                val = TemporaryVariable(self._node)
+                var = TypeConversion(val, _this, _address_type)
+                val.set_type(_address_type)
+                self._result.append(var)
+                self._this_as_address = val
+            if name == "selfbalance()":
+                val1 = ReferenceVariable(self._node)
+                var1 = Member(val, Constant("balance"), val1)
+                self._result.append(var1)
+                set_val(expression, val1)
+            else:
+                set_val(expression, val)
 
     def _post_conditional_expression(self, expression: ConditionalExpression) -> None:
         raise Exception(f"Ternary operator are not convertible to SlithIR {expression}")
@@ -474,18 +635,19 @@ class ExpressionToSlithIR(ExpressionVisitor):
         set_val(expression, cst)
 
     def _post_member_access(self, expression: MemberAccess) -> None:
-        if self._node.compilation_unit.generates_certik_ir and self._attempt_constant_folding(expression):
+        if self._fold_constants and self._attempt_constant_folding(expression):
             return
 
         expr = get(expression.expression)
+        member_name = expression.member_name
+        # Checked once, several of the cases below depend on them
+        expr_is_variable = isinstance(expr, Variable)
+        expr_is_contract = isinstance(expr, Contract)
 
         # Look for type(X).max / min
         # Because we looked at the AST structure, we need to look into the nested expression
         # Hopefully this is always on a direct sub field, and there is no weird construction
-        if isinstance(expression.expression, CallExpression) and expression.member_name in [
-            "min",
-            "max",
-        ]:
+        if member_name in ("min", "max") and isinstance(expression.expression, CallExpression):
             if isinstance(expression.expression.called, Identifier):
                 if expression.expression.called.value == SolidityFunction("type()"):
                     assert len(expression.expression.arguments) == 1
@@ -506,7 +668,7 @@ class ExpressionToSlithIR(ExpressionVisitor):
                         type_found = UserDefinedType(type_found_in_expression)
                         min_value = type_found_in_expression.min
                         max_value = type_found_in_expression.max
-                    if expression.member_name == "min":
+                    if member_name == "min":
                         op = Assignment(
                             val,
                             Constant(str(min_value), type_found),
@@ -524,12 +686,12 @@ class ExpressionToSlithIR(ExpressionVisitor):
 
         # This does not support solidity 0.4 contract_name.balance
         if (
-            isinstance(expr, Variable)
-            and expr.type == ElementaryType("address")
-            and expression.member_name in ["balance", "code", "codehash"]
+            expr_is_variable
+            and member_name in ("balance", "code", "codehash")
+            and expr.type == _address_type
         ):
             val = TemporaryVariable(self._node)
-            name = expression.member_name + "(address)"
+            name = member_name + "(address)"
             sol_func = SolidityFunction(name)
             s = SolidityCall(
                 sol_func,
@@ -538,47 +700,47 @@ class ExpressionToSlithIR(ExpressionVisitor):
                 sol_func.return_type,
             )
             s.set_expression(expression)
-            s.arguments.append(expr)
+            s.add_argument(expr)
             self._result.append(s)
             set_val(expression, val)
             return
 
-        if isinstance(expr, TypeAlias) and expression.member_name in ["wrap", "unwrap"]:
+        if isinstance(expr, TypeAlias) and member_name in ("wrap", "unwrap"):
             # The logic is be handled by _post_call_expression
             set_val(expression, expr)
             return
 
-        if isinstance(expr, Contract):
+        if expr_is_contract:
             # Early lookup to detect user defined types from other contracts definitions
             # contract A { type MyInt is int}
             # contract B { function f() public{ A.MyInt test = A.MyInt.wrap(1);}}
             # The logic is handled by _post_call_expression
-            if expression.member_name in expr.file_scope.user_defined_types:
-                set_val(expression, expr.file_scope.user_defined_types[expression.member_name])
+            if member_name in expr.file_scope.user_defined_types:
+                set_val(expression, expr.file_scope.user_defined_types[member_name])
                 return
             # Lookup errors referred to as member of contract e.g. Test.myError.selector
-            if expression.member_name in expr.custom_errors_as_dict:
-                set_val(expression, expr.custom_errors_as_dict[expression.member_name])
+            if member_name in expr.custom_errors_as_dict:
+                set_val(expression, expr.custom_errors_as_dict[member_name])
                 return
 
         val_ref = ReferenceVariable(self._node)
         if (
-            isinstance(expr, Variable)
+            expr_is_variable
             and isinstance(expr.type, UserDefinedType)
             and isinstance(expr.type.type, Structure)
-            and expression.member_name in expr.type.type.elems
+            and member_name in expr.type.type.elems
         ):
-            val_ref.set_type(expr.type.type.elems[expression.member_name].type)
+            val_ref.set_type(expr.type.type.elems[member_name].type)
 
-        if isinstance(expr, Contract):
-            if expression.member_name in expr.structures_as_dict:
-                type = UserDefinedType(expr.structures_as_dict[expression.member_name])
+        if expr_is_contract:
+            if member_name in expr.structures_as_dict:
+                type = UserDefinedType(expr.structures_as_dict[member_name])
                 val_ref.set_type(Typename(type))
-            if expression.member_name in expr.enums_as_dict:
-                type = UserDefinedType(expr.enums_as_dict[expression.member_name])
+            if member_name in expr.enums_as_dict:
+                type = UserDefinedType(expr.enums_as_dict[member_name])
                 val_ref.set_type(Typename(type))
 
-        member = Member(expr, Constant(expression.member_name), val_ref)
+        member = Member(expr, Constant(member_name), val_ref)
         member.set_expression(expression)
         self._result.append(member)
         set_val(expression, val_ref)
@@ -613,15 +775,18 @@ class ExpressionToSlithIR(ExpressionVisitor):
         set_val(expression, val)
 
     def _post_tuple_expression(self, expression: TupleExpression) -> None:
-        all_expressions = [get(e) if e else None for e in expression.expressions]
+        exprs = expression.expressions
+        if not expression.is_inline_array and len(exprs) == 1:
+            # Parenthesized expression, no need to build the list
+            set_val(expression, get(exprs[0]) if exprs[0] else None)
+            return
+        all_expressions = [get(e) if e else None for e in exprs]
         if expression.is_inline_array:
             temp_var = TemporaryVariable(self._node)
             init_arr = InitArray(all_expressions, temp_var)
             self._result.append(init_arr)
             # Use the new temporary variable in place of the array.
             val = temp_var
-        elif len(all_expressions) == 1:
-            val = all_expressions[0]
         else:
             val = all_expressions
         set_val(expression, val)
@@ -638,59 +803,73 @@ class ExpressionToSlithIR(ExpressionVisitor):
         self._result.append(operation)
         set_val(expression, val)
 
-    # pylint: disable=too-many-statements
     def _post_unary_operation(self, expression: UnaryOperation) -> None:
-        if self._node.compilation_unit.generates_certik_ir and self._attempt_constant_folding(expression):
+        if self._fold_constants and self._attempt_constant_folding(expression):
             return
 
         value = get(expression.expression)
-        operation: Operation
-        if expression.type in [UnaryOperationType.BANG, UnaryOperationType.TILD]:
-            lvalue = TemporaryVariable(self._node)
-            operation = Unary(lvalue, value, expression.type)
-            operation.set_expression(expression)
-            self._result.append(operation)
-            set_val(expression, lvalue)
-        elif expression.type in [UnaryOperationType.DELETE]:
-            operation = Delete(value, value)
-            operation.set_expression(expression)
-            self._result.append(operation)
-            set_val(expression, value)
-        elif expression.type in [UnaryOperationType.PLUSPLUS_PRE]:
-            operation = Binary(value, value, Constant("1", value.type), BinaryType.ADDITION)
-            operation.set_expression(expression)
-            self._result.append(operation)
-            set_val(expression, value)
-        elif expression.type in [UnaryOperationType.MINUSMINUS_PRE]:
-            operation = Binary(value, value, Constant("1", value.type), BinaryType.SUBTRACTION)
-            operation.set_expression(expression)
-            self._result.append(operation)
-            set_val(expression, value)
-        elif expression.type in [UnaryOperationType.PLUSPLUS_POST]:
-            lvalue = TemporaryVariable(self._node)
-            operation = Assignment(lvalue, value, value.type)
-            operation.set_expression(expression)
-            self._result.append(operation)
-            operation = Binary(value, value, Constant("1", value.type), BinaryType.ADDITION)
-            operation.set_expression(expression)
-            self._result.append(operation)
-            set_val(expression, lvalue)
-        elif expression.type in [UnaryOperationType.MINUSMINUS_POST]:
-            lvalue = TemporaryVariable(self._node)
-            operation = Assignment(lvalue, value, value.type)
-            operation.set_expression(expression)
-            self._result.append(operation)
-            operation = Binary(value, value, Constant("1", value.type), BinaryType.SUBTRACTION)
-            operation.set_expression(expression)
-            self._result.append(operation)
-            set_val(expression, lvalue)
-        elif expression.type in [UnaryOperationType.PLUS_PRE]:
-            set_val(expression, value)
-        elif expression.type in [UnaryOperationType.MINUS_PRE]:
-            lvalue = TemporaryVariable(self._node)
-            operation = Binary(lvalue, Constant("0", value.type), value, BinaryType.SUBTRACTION)
-            operation.set_expression(expression)
-            self._result.append(operation)
-            set_val(expression, lvalue)
-        else:
+        convert = self._unary_conversions.get(expression.type)
+        if convert is None:
             raise SlithIRError(f"Unary operation to IR not supported {expression}")
+        convert(self, expression, value)
+
+    def _convert_unary(self, expression: UnaryOperation, value: Any) -> None:
+        # !x and ~x
+        lvalue = TemporaryVariable(self._node)
+        operation = Unary(lvalue, value, expression.type)
+        operation.set_expression(expression)
+        self._result.append(operation)
+        set_val(expression, lvalue)
+
+    def _convert_delete(self, expression: UnaryOperation, value: Any) -> None:
+        operation = Delete(value, value)
+        operation.set_expression(expression)
+        self._result.append(operation)
+        set_val(expression, value)
+
+    def _convert_pre_step(self, expression: UnaryOperation, value: Any) -> None:
+        # ++x and --x
+        operation = Binary(value, value, Constant("1", value.type), _unary_step[expression.type])
+        operation.set_expression(expression)
+        self._result.append(operation)
+        set_val(expression, value)
+
+    def _convert_post_step(self, expression: UnaryOperation, value: Any) -> None:
+        # x++ and x--, the expression evaluates to the value before the step
+        if self._is_statement and expression is self.expression:
+            # The value before the step is not used, x++; is converted as ++x;
+            self._convert_pre_step(expression, value)
+            return
+        lvalue = TemporaryVariable(self._node)
+        operation: Operation = Assignment(lvalue, value, value.type)
+        operation.set_expression(expression)
+        self._result.append(operation)
+        operation = Binary(value, value, Constant("1", value.type), _unary_step[expression.type])
+        operation.set_expression(expression)
+        self._result.append(operation)
+        set_val(expression, lvalue)
+
+    # pylint: disable=no-self-use
+    def _convert_plus(self, expression: UnaryOperation, value: Any) -> None:
+        set_val(expression, value)
+
+    def _convert_minus(self, expression: UnaryOperation, value: Any) -> None:
+        lvalue = TemporaryVariable(self._node)
+        operation = Binary(lvalue, Constant("0", value.type), value, BinaryType.SUBTRACTION)
+        operation.set_expression(expression)
+        self._result.append(operation)
+        set_val(expression, lvalue)
+
+    _unary_conversions: Dict[
+        UnaryOperationType, Callable[["ExpressionToSlithIR", UnaryOperation, Any], None]
+    ] = {
+        UnaryOperationType.BANG: _convert_unary,
+        UnaryOperationType.TILD: _convert_unary,
+        UnaryOperationType.DELETE: _convert_delete,
+        UnaryOperationType.PLUSPLUS_PRE: _convert_pre_step,
+        UnaryOperationType.MINUSMINUS_PRE: _convert_pre_step,
+        UnaryOperationType.PLUSPLUS_POST: _convert_post_step,
+        UnaryOperationType.MINUSMINUS_POST: _convert_post_step,
+        UnaryOperationType.PLUS_PRE: _convert_plus,
+        UnaryOperationType.MINUS_PRE: _convert_minus,
+    }
@@ -9,6 +9,7 @@ from pathlib import Path
 from slither import Slither
 from slither.core.declarations.function import FunctionType
 from slither.core.solidity_types.elementary_type import ElementaryType
+from slither.slithir.operations import Call, LowLevelCall, Send
 
 TEST_DATA_DIR = Path(__file__).resolve().parent / "test_data"
 FUNC_DELC_TEST_ROOT = Path(TEST_DATA_DIR, "function_declaration")
@@ -302,3 +303,26 @@ def test_public_variable(solc_binary_path) -> None:
     assert var.signature_str == "info() returns(bytes32)"
     assert var.visibility == "public"
     assert var.type == ElementaryType("bytes32")
+
+
+def test_has_slithir_operation_of_type(solc_binary_path) -> None:
+    solc_path = solc_binary_path("0.6.12")
+    file = Path(FUNC_DELC_TEST_ROOT, "test_function.sol").as_posix()
+    slither = Slither(file, solc=solc_path)
+    compilation_unit = slither.compilation_units[0]
+    functions = compilation_unit.get_contract_from_name("TestFunctionCanSendEth")[
+        0
+    ].available_functions_as_dict()
+
+    f = functions["send_direct()"]
+    assert f.has_slithir_operation_of_type(Send)
+    # Subclasses are included
+    assert f.has_slithir_operation_of_type(Call)
+    assert not f.has_slithir_operation_of_type(LowLevelCall)
+
+    f = functions["call_direct()"]
+    assert f.has_slithir_operation_of_type(LowLevelCall)
+    assert not f.has_slithir_operation_of_type(Send)
+
+    f = functions["send_via_internal()"]
+    assert not f.has_slithir_operation_of_type(Send)
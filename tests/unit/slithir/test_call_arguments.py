@@ -0,0 +1,41 @@
+from slither.slithir.operations import EventCall
+from slither.slithir.variables import Constant
+
+
+def test_add_argument_on_empty_call() -> None:
+    call = EventCall("Event")
+    assert len(call.arguments) == 0
+    arg = Constant("1")
+    call.add_argument(arg)
+    assert call.arguments == [arg]
+    # Calls without arguments share the empty arguments
+    assert len(EventCall("Event").arguments) == 0
+
+
+def test_freeze() -> None:
+    call = EventCall("Event")
+    call.freeze()
+    assert call.arguments == ()
+
+    args = [Constant("1"), Constant("2")]
+    call = EventCall("Event")
+    for arg in args:
+        call.add_argument(arg)
+    call.freeze()
+    assert isinstance(call.arguments, tuple)
+    assert list(call.arguments) == args
+
+
+def test_add_argument_on_frozen_call() -> None:
+    first, second = Constant("1"), Constant("2")
+
+    call = EventCall("Event")
+    call.freeze()
+    call.add_argument(first)
+    assert call.arguments == [first]
+
+    call = EventCall("Event")
+    call.add_argument(first)
+    call.freeze()
+    call.add_argument(second)
+    assert call.arguments == [first, second]
@@ -0,0 +1,21 @@
+from slither.slithir.operations import LowLevelCall, Send
+
+
+def test_subclasses_are_registered() -> None:
+    class CustomLowLevelCall(LowLevelCall):  # pylint: disable=too-few-public-methods
+        pass
+
+    class CustomSend(Send):  # pylint: disable=too-few-public-methods
+        pass
+
+    low_level_call = object.__new__(CustomLowLevelCall)
+    send = object.__new__(CustomSend)
+
+    assert LowLevelCall.is_low_level_call(low_level_call)
+    assert not LowLevelCall.is_low_level_call(send)
+    assert Send.is_send(send)
+    assert not Send.is_send(low_level_call)
+    assert not Send.is_send(object())
+    # Each root has its own registry
+    assert CustomLowLevelCall not in Send._registered_types
+    assert CustomSend not in LowLevelCall._registered_types
@@ -0,0 +1,89 @@
+from slither.core.cfg.node import NodeType
+from slither.slithir.operations import Assignment, Binary, BinaryType, Return
+
+
+def _node_of(function, expression: str):
+    nodes = [node for node in function.nodes if str(node.expression) == expression]
+    assert len(nodes) == 1
+    return nodes[0]
+
+
+def test_statement_post_step_is_not_copied(slither_from_source) -> None:
+    source = """
+    pragma solidity ^0.8.19;
+    contract Test {
+        uint x;
+        function statement(uint i) external {
+            i++;
+            i--;
+            x = i;
+        }
+        function loop() external {
+            for (uint i = 0; i < 10; i++) {
+                x += i;
+            }
+        }
+    }
+    """
+    with slither_from_source(source) as slither:
+        c = slither.get_contract_from_name("Test")[0]
+
+        f = c.get_function_from_signature("statement(uint256)")
+        for expression, binary_type in [
+            ("i ++", BinaryType.ADDITION),
+            ("i --", BinaryType.SUBTRACTION),
+        ]:
+            node = _node_of(f, expression)
+            assert node.type == NodeType.EXPRESSION
+            assert len(node.irs) == 1
+            ir = node.irs[0]
+            assert isinstance(ir, Binary)
+            assert ir.type == binary_type
+            assert ir.lvalue.name == "i"
+
+        f = c.get_function_from_signature("loop()")
+        node = _node_of(f, "i ++")
+        assert len(node.irs) == 1
+        assert isinstance(node.irs[0], Binary)
+        assert node.irs[0].type == BinaryType.ADDITION
+
+
+def test_used_post_step_is_copied(slither_from_source) -> None:
+    source = """
+    pragma solidity ^0.8.19;
+    contract Test {
+        uint x;
+        function assigned(uint i) external {
+            x = i++;
+        }
+        function returned(uint i) external returns (uint) {
+            return i--;
+        }
+    }
+    """
+    with slither_from_source(source) as slither:
+        c = slither.get_contract_from_name("Test")[0]
+
+        f = c.get_function_from_signature("assigned(uint256)")
+        node = _node_of(f, "x = i ++")
+        assert len(node.irs) == 3
+        copy, step, assignment = node.irs
+        assert isinstance(copy, Assignment)
+        assert copy.rvalue.name == "i"
+        assert isinstance(step, Binary)
+        assert step.type == BinaryType.ADDITION
+        assert isinstance(assignment, Assignment)
+        assert assignment.lvalue.name == "x"
+        assert assignment.rvalue == copy.lvalue
+
+        f = c.get_function_from_signature("returned(uint256)")
+        node = _node_of(f, "i --")
+        assert node.type == NodeType.RETURN
+        assert len(node.irs) == 3
+        copy, step, ret = node.irs
+        assert isinstance(copy, Assignment)
+        assert copy.rvalue.name == "i"
+        assert isinstance(step, Binary)
+        assert step.type == BinaryType.SUBTRACTION
+        assert isinstance(ret, Return)
+        assert ret.values == [copy.lvalue]
@@ -0,0 +1,51 @@
+from slither.core.declarations.solidity_variables import SolidityFunction, SolidityVariable
+from slither.core.solidity_types import ElementaryType
+from slither.slithir.operations import Binary, SolidityCall, TypeConversion
+
+
+def _this_conversions(node):
+    return [ir for ir in node.irs if isinstance(ir, TypeConversion)]
+
+
+def test_selfbalance_and_address_share_this_conversion(slither_from_source) -> None:
+    source = """
+    pragma solidity ^0.8.19;
+    contract Test {
+        function f() external view returns (uint256 b, uint256 c) {
+            assembly {
+                b := add(selfbalance(), address())
+                c := selfbalance()
+            }
+        }
+    }
+    """
+    with slither_from_source(source) as slither:
+        c = slither.get_contract_from_name("Test")[0]
+        f = c.get_function_from_signature("f()")
+        nodes = [node for node in f.nodes if _this_conversions(node)]
+        assert len(nodes) == 2
+        first, second = nodes
+
+        # selfbalance() and address() of the same statement use a single address(this)
+        conversions = _this_conversions(first)
+        assert len(conversions) == 1
+        conversion = conversions[0]
+        assert conversion.variable == SolidityVariable("this")
+        assert conversion.type == ElementaryType("address")
+        this_address = conversion.lvalue
+        balances = [ir for ir in first.irs if isinstance(ir, SolidityCall)]
+        assert len(balances) == 1
+        assert balances[0].function == SolidityFunction("balance(address)")
+        assert list(balances[0].arguments) == [this_address]
+        additions = [ir for ir in first.irs if isinstance(ir, Binary)]
+        assert len(additions) == 1
+        assert additions[0].read == [balances[0].lvalue, this_address]
+        assert first.irs.index(conversion) < first.irs.index(balances[0])
+
+        # The conversion is not shared with another statement
+        conversions = _this_conversions(second)
+        assert len(conversions) == 1
+        assert conversions[0].lvalue != this_address
+        balances = [ir for ir in second.irs if isinstance(ir, SolidityCall)]
+        assert len(balances) == 1
+        assert list(balances[0].arguments) == [conversions[0].lvalue]